@@ -1,36 +1,109 @@
 import os
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify
-from flask_cors import CORS
-
-from .routes.animals import animals_bp
-from .routes.breeding_records import breeding_bp
-from .routes.feeding_tasks import feeding_bp
-from .routes.health_records import health_bp
-from .routes.inventory import inventory_bp
+from pymongo.errors import PyMongoError
+from quart import Quart
+from quart_cors import cors
+
+from .db import get_db
+from .routes import inventory
+from .routes._crud import make_crud_blueprint
+from .routes.helpers import ensure_indexes, ojson
 from .routes.settings import settings_bp
-from .routes.staff import staff_bp
+
+_ANIMAL_REQUIRED = frozenset({"name", "species", "breed", "age", "gender", "status"})
+_HEALTH_RECORD_REQUIRED = frozenset({"animalId", "recordType", "description", "date", "veterinarian", "status"})
+_FEEDING_TASK_REQUIRED = frozenset(
+    {"animalId", "animalName", "foodType", "quantity", "time", "frequency", "status", "startDate"}
+)
+_BREEDING_RECORD_REQUIRED = frozenset({"motherId", "fatherId", "matingDate", "dueDate", "status"})
+_INVENTORY_ITEM_REQUIRED = frozenset({"name", "category", "quantity", "unit", "reorderLevel", "costPerUnit"})
+_STAFF_MEMBER_REQUIRED = frozenset({"name", "role", "email", "phone", "status", "joined"})
 
 
-def create_app() -> Flask:
+def create_app() -> Quart:
     load_dotenv()
 
-    app = Flask(__name__)
-    CORS(app)
+    app = cors(Quart(__name__))
 
     # Register blueprints
-    app.register_blueprint(animals_bp)
-    app.register_blueprint(health_bp)
-    app.register_blueprint(feeding_bp)
-    app.register_blueprint(breeding_bp)
-    app.register_blueprint(inventory_bp)
-    app.register_blueprint(staff_bp)
+    app.register_blueprint(
+        make_crud_blueprint(
+            resource="animals",
+            id_prefix="A",
+            required_fields=_ANIMAL_REQUIRED,
+            url_prefix="/api/animals",
+            collection_name="animals",
+            label="Animal",
+        )
+    )
+    app.register_blueprint(
+        make_crud_blueprint(
+            resource="health_records",
+            id_prefix="H",
+            required_fields=_HEALTH_RECORD_REQUIRED,
+            url_prefix="/api/health-records",
+            collection_name="healthrecords",
+            label="Health record",
+        )
+    )
+    app.register_blueprint(
+        make_crud_blueprint(
+            resource="feeding_tasks",
+            id_prefix="F",
+            required_fields=_FEEDING_TASK_REQUIRED,
+            url_prefix="/api/feeding-tasks",
+            collection_name="feedingtasks",
+            label="Feeding task",
+        )
+    )
+    app.register_blueprint(
+        make_crud_blueprint(
+            resource="breeding_records",
+            id_prefix="B",
+            required_fields=_BREEDING_RECORD_REQUIRED,
+            url_prefix="/api/breeding-records",
+            collection_name="breedingrecords",
+            label="Breeding record",
+        )
+    )
+    app.register_blueprint(
+        make_crud_blueprint(
+            resource="inventory",
+            id_prefix="I",
+            required_fields=_INVENTORY_ITEM_REQUIRED,
+            url_prefix="/api/inventory",
+            collection_name="inventoryitems",
+            label="Inventory item",
+            prepare_create=inventory.prepare_create,
+            prepare_update=inventory.prepare_update,
+            update_stages=inventory.STATUS_STAGES,
+        )
+    )
+    app.register_blueprint(
+        make_crud_blueprint(
+            resource="staff",
+            id_prefix="S",
+            required_fields=_STAFF_MEMBER_REQUIRED,
+            url_prefix="/api/staff",
+            collection_name="staffmembers",
+            label="Staff member",
+        )
+    )
     app.register_blueprint(settings_bp)
 
+    @app.before_serving
+    async def prepare_mongo():
+        # The ping opens the first pooled connection (TCP, TLS, auth) before any request needs it.
+        try:
+            await get_db().command("ping")
+            await ensure_indexes()
+        except PyMongoError as exc:
+            app.logger.warning("MongoDB startup checks failed: %s", exc)
+
     @app.get("/api/health")
-    def health_check():
-        return jsonify({"status": "OK", "message": "Server is running"})
+    async def health_check():
+        return ojson({"status": "OK", "message": "Server is running"})
 
     return app
 
@@ -39,6 +112,7 @@ app = create_app()
 
 
 if __name__ == "__main__":
+    # Development server only; production runs the ASGI app under uvicorn (see README).
     port = int(os.getenv("PORT", "5000"))
     app.run(host="0.0.0.0", port=port, debug=os.getenv("FLASK_ENV") != "production")
 
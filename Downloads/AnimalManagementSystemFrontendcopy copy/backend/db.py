@@ -1,16 +1,53 @@
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient
+from pymongo.uri_parser import split_options
+
+
+# Connection pool, compression and timeout defaults for the Mongo client. Each one only
+# applies when the URI doesn't set that option itself. Compressors are negotiated with the
+# server (zstd needs MongoDB 4.2+); unsupported ones are skipped.
+_CLIENT_DEFAULTS: Dict[str, Any] = {
+    "maxPoolSize": 200,
+    "minPoolSize": 20,
+    "compressors": "zstd,snappy",
+    "serverSelectionTimeoutMS": 3000,
+    "connectTimeoutMS": 3000,
+    "socketTimeoutMS": 10000,
+    "retryWrites": True,
+}
+
+# Environment variables that, when set, take precedence over both the URI and the defaults.
+_POOL_ENV_VARS = {"maxPoolSize": "MONGODB_POOL_MAX", "minPoolSize": "MONGODB_POOL_MIN"}
+
+
+def _client_options(uri: str) -> Dict[str, Any]:
+    """
+    Keyword options for the Mongo client that don't override options given in `uri`.
+    """
+    query = uri.partition("?")[2]
+    uri_options = split_options(query) if query else {}
+    options = {name: value for name, value in _CLIENT_DEFAULTS.items() if name not in uri_options}
+    for name, env_var in _POOL_ENV_VARS.items():
+        value = os.getenv(env_var)
+        if value:
+            options[name] = int(value)
+    if "minPoolSize" not in uri_options and not os.getenv("MONGODB_POOL_MIN"):
+        # Keep the default minimum within a smaller maximum set in the URI or environment.
+        max_pool = options.get("maxPoolSize", uri_options.get("maxPoolSize"))
+        if max_pool:
+            options["minPoolSize"] = min(options["minPoolSize"], max_pool)
+    return options
 
 
 def _get_database_from_uri(uri: str, fallback: Optional[str] = None):
     """
     Return the database object defined in the Mongo URI or use the fallback name.
-    pymongo.MongoClient automatically selects the database if one is included in the URI path.
+    pymongo.AsyncMongoClient automatically selects the database if one is included in the URI path.
     """
-    client = MongoClient(uri)
+    client = AsyncMongoClient(uri, **_client_options(uri))
 
     # When a database is provided in the URI, get_default_database returns it.
     db = client.get_default_database()
@@ -25,10 +62,8 @@ def _get_database_from_uri(uri: str, fallback: Optional[str] = None):
 @lru_cache(maxsize=1)
 def get_db():
     """
-    Cached accessor for the Mongo database connection.
+    Cached accessor for the async Mongo database connection.
     """
     mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/animal-management")
     fallback_db = os.getenv("MONGODB_DB_NAME", "animal-management")
     return _get_database_from_uri(mongo_uri, fallback_db)
-
-
@@ -0,0 +1,177 @@
+from http import HTTPStatus
+from typing import Any, Callable, Dict, FrozenSet, Optional, Sequence
+
+from pymongo.errors import BulkWriteError
+from quart import Blueprint, request
+
+from ..utils.id_generator import get_next_id, get_next_ids, timestamp_pair
+from .helpers import (
+    apply_update,
+    build_id_filter,
+    get_collection,
+    list_cursor,
+    ojson,
+    projection_for,
+    serialize_document,
+    stream_documents,
+)
+from .read_cache import cached_document, invalidate_document, store_document
+
+# Upper bound on the array accepted by a bulk create, keeping one request's insert bounded.
+_MAX_BULK_ITEMS = 1000
+
+
+def make_crud_blueprint(
+    resource: str,
+    id_prefix: str,
+    required_fields: FrozenSet[str],
+    url_prefix: str,
+    collection_name: str,
+    label: str,
+    prepare_create: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    prepare_update: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    update_stages: Sequence[Dict[str, Any]] = (),
+) -> Blueprint:
+    """
+    Build the standard list/get/create/bulk/update/delete blueprint for a record collection.
+    `label` is the singular, human-readable name used in messages (e.g. "Health record").
+
+    Resources with derived fields can pass `prepare_create` (applied to each validated payload
+    before the id and timestamps are added), `prepare_update` (applied to update payloads) and
+    `update_stages` (pipeline stages run after the update's `$set`, see `apply_update`).
+    """
+    bp = Blueprint(resource, __name__, url_prefix=url_prefix)
+    not_found = {"error": f"{label} not found"}
+
+    async def _collection():
+        return await get_collection(collection_name)
+
+    @bp.get("/")
+    async def list_records():
+        cursor = await list_cursor(await _collection())
+        if cursor is None:
+            return ojson({"error": f"No {label.lower()} matches after_id"}, HTTPStatus.BAD_REQUEST)
+        return stream_documents(cursor)
+
+    @bp.get("/<record_id>")
+    async def get_record(record_id: str):
+        cached, generation = cached_document((collection_name, record_id))
+        if cached is not None:
+            return ojson(cached)
+
+        id_filter = build_id_filter(record_id)
+        collection = await _collection()
+        doc = await collection.find_one(id_filter, projection_for(id_filter))
+        if not doc:
+            return ojson(not_found, HTTPStatus.NOT_FOUND)
+
+        serialized = serialize_document(doc)
+        store_document((collection_name, record_id), serialized, generation)
+        return ojson(serialized)
+
+    @bp.post("/")
+    async def create_record():
+        payload: Dict[str, Any] = (await request.get_json(silent=True)) or {}
+        missing = sorted(required_fields.difference(payload))
+        if missing:
+            return ojson({"error": f"Missing required fields: {', '.join(missing)}"}, HTTPStatus.BAD_REQUEST)
+
+        if prepare_create is not None:
+            payload = prepare_create(payload)
+
+        collection = await _collection()
+        new_id = await get_next_id(collection, id_prefix, 3)
+        created_at, updated_at = timestamp_pair()
+
+        document = {
+            **payload,
+            "id": new_id,
+            "createdAt": created_at,
+            "updatedAt": updated_at,
+        }
+
+        await collection.insert_one(document)
+        return ojson(serialize_document(document), HTTPStatus.CREATED)
+
+    @bp.post("/bulk")
+    async def create_records_bulk():
+        payload = await request.get_json(silent=True)
+        if not isinstance(payload, list) or not payload:
+            return ojson({"error": f"Expected a non-empty array of {label.lower()}s"}, HTTPStatus.BAD_REQUEST)
+        if len(payload) > _MAX_BULK_ITEMS:
+            return ojson(
+                {"error": f"At most {_MAX_BULK_ITEMS} {label.lower()}s can be created per request"},
+                HTTPStatus.BAD_REQUEST,
+            )
+        for index, item in enumerate(payload):
+            if not isinstance(item, dict):
+                return ojson({"error": f"Item {index} is not an object"}, HTTPStatus.BAD_REQUEST)
+            missing = sorted(required_fields.difference(item))
+            if missing:
+                return ojson(
+                    {"error": f"Item {index}: Missing required fields: {', '.join(missing)}"},
+                    HTTPStatus.BAD_REQUEST,
+                )
+        if prepare_create is not None:
+            payload = [prepare_create(item) for item in payload]
+
+        collection = await _collection()
+        new_ids = await get_next_ids(collection, id_prefix, len(payload), 3)
+        created_at, updated_at = timestamp_pair()
+
+        documents = [
+            {
+                **item,
+                "id": new_id,
+                "createdAt": created_at,
+                "updatedAt": updated_at,
+            }
+            for item, new_id in zip(payload, new_ids)
+        ]
+
+        try:
+            await collection.insert_many(documents, ordered=False)
+        except BulkWriteError as exc:
+            # Unordered inserts keep going past failures; report which items made it in.
+            write_errors = exc.details.get("writeErrors", [])
+            errors = {error["index"]: error.get("errmsg", "Write failed") for error in write_errors}
+            return ojson(
+                {
+                    "inserted": [
+                        serialize_document(document) for index, document in enumerate(documents) if index not in errors
+                    ],
+                    "failed": [
+                        {"index": index, "id": documents[index]["id"], "error": message}
+                        for index, message in sorted(errors.items())
+                    ],
+                },
+                HTTPStatus.MULTI_STATUS,
+            )
+        return ojson([serialize_document(document) for document in documents], HTTPStatus.CREATED)
+
+    @bp.put("/<record_id>")
+    async def update_record(record_id: str):
+        updates: Dict[str, Any] = (await request.get_json(silent=True)) or {}
+        if not updates:
+            return ojson({"error": "No data provided"}, HTTPStatus.BAD_REQUEST)
+
+        if prepare_update is not None:
+            updates = prepare_update(updates)
+
+        id_filter = build_id_filter(record_id)
+        updated = await apply_update(await _collection(), id_filter, updates, update_stages)
+        invalidate_document((collection_name, record_id))
+        if not updated:
+            return ojson(not_found, HTTPStatus.NOT_FOUND)
+        return ojson(serialize_document(updated))
+
+    @bp.delete("/<record_id>")
+    async def delete_record(record_id: str):
+        collection = await _collection()
+        deleted = await collection.find_one_and_delete(build_id_filter(record_id))
+        invalidate_document((collection_name, record_id))
+        if not deleted:
+            return ojson(not_found, HTTPStatus.NOT_FOUND)
+        return ojson({"message": f"{label} deleted successfully"})
+
+    return bp
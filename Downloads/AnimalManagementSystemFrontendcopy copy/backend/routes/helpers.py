@@ -1,10 +1,21 @@
+import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
 
+import bsonjs
+import orjson
 from bson import ObjectId
-from pymongo.collection import Collection
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.command_cursor import AsyncCommandCursor
+from pymongo.errors import ConnectionFailure, PyMongoError
+from quart import Response, current_app, request
 
 from ..db import get_db
+from ..utils.timestamps import iso_now
 
 _COLLECTION_ALIASES: Dict[str, Iterable[str]] = {
     "animals": ("animalRegistry", "Animals"),
@@ -16,13 +27,115 @@ _COLLECTION_ALIASES: Dict[str, Iterable[str]] = {
     "settings": ("facilitySettings", "configuration"),
 }
 
+# Collections holding a single document that is never looked up by `id` or listed.
+_UNINDEXED_COLLECTIONS = frozenset({"settings"})
 
-def get_collection(name: str) -> Collection:
+_RECORD_INDEXES = [
+    # Partial so legacy documents without a custom `id` don't collide on null.
+    IndexModel(
+        [("id", ASCENDING)],
+        unique=True,
+        partialFilterExpression={"id": {"$exists": True}},
+    ),
+    IndexModel([("createdAt", DESCENDING), ("_id", DESCENDING)]),
+]
+
+# Documents fetched per getMore while streaming list responses.
+_LIST_BATCH_SIZE = 500
+
+# Hex form of an ObjectId, checked before any ObjectId parsing.
+_OBJECT_ID_HEX = re.compile(r"[0-9a-fA-F]{24}")
+
+# Mongo-internal fields never exposed through the API.
+_INTERNAL_FIELDS = frozenset({"_id", "__v"})
+
+# Drop Mongo-internal fields server-side. `ID_FALLBACK_PROJECTION` keeps `_id` for
+# lookups that may match legacy documents whose only identifier is the ObjectId.
+DEFAULT_PROJECTION: Dict[str, int] = {"_id": 0, "__v": 0}
+ID_FALLBACK_PROJECTION: Dict[str, int] = {"__v": 0}
+
+# Datetimes are handed to `_orjson_default`, which renders them in the same format as
+# `_DATE_FORMAT` in `_LIST_SHAPE`.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Millisecond-precision UTC timestamp (Mongo dates carry milliseconds), as `$dateToString` format.
+_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%LZ"
+
+_RAW_CODEC_OPTIONS: CodecOptions = CodecOptions(document_class=RawBSONDocument)
+
+# Mirrors `serialize_document` + `ojson` in the database: expose `id` (falling back to the
+# stringified `_id`), drop the Mongo-internal fields and turn top-level dates and ObjectIds
+# into strings, since bsonjs would otherwise emit `{"$date": ...}` / `{"$oid": ...}`.
+_LIST_SHAPE: List[Dict[str, Any]] = [
+    {
+        "$set": {
+            "id": {
+                "$switch": {
+                    "branches": [
+                        {"case": {"$eq": [{"$type": "$id"}, "missing"]}, "then": {"$toString": "$_id"}},
+                        {"case": {"$eq": [{"$type": "$id"}, "objectId"]}, "then": {"$toString": "$id"}},
+                    ],
+                    "default": "$id",
+                }
+            }
+        }
+    },
+    {"$unset": ["_id", "__v"]},
+    {
+        "$replaceWith": {
+            "$arrayToObject": {
+                "$map": {
+                    "input": {"$objectToArray": "$$ROOT"},
+                    "in": {
+                        "k": "$$this.k",
+                        "v": {
+                            "$switch": {
+                                "branches": [
+                                    {
+                                        "case": {"$eq": [{"$type": "$$this.v"}, "date"]},
+                                        "then": {
+                                            "$dateToString": {
+                                                "date": "$$this.v",
+                                                "format": _DATE_FORMAT,
+                                            }
+                                        },
+                                    },
+                                    {
+                                        "case": {"$eq": [{"$type": "$$this.v"}, "objectId"]},
+                                        "then": {"$toString": "$$this.v"},
+                                    },
+                                ],
+                                "default": "$$this.v",
+                            }
+                        },
+                    },
+                }
+            }
+        }
+    },
+]
+
+# Resolved collections keyed by logical name; collection names don't change at runtime.
+_RESOLVED: Dict[str, AsyncCollection] = {}
+
+
+async def get_collection(name: str) -> AsyncCollection:
     """
     Return a MongoDB collection, falling back to legacy naming conventions when present.
+    The lookup runs once per logical name; later calls are served from `_RESOLVED`.
     """
+    resolved = _RESOLVED.get(name)
+    if resolved is not None:
+        return resolved
+
+    resolved = await _resolve_collection(name)
+    _RESOLVED[name] = resolved
+    return resolved
+
+
+async def _resolve_collection(name: str) -> AsyncCollection:
     db = get_db()
-    available = {coll.casefold(): coll for coll in db.list_collection_names()}
+    available = {coll.casefold(): coll for coll in await db.list_collection_names()}
     primary_key = name.casefold()
     if primary_key in available:
         return db[available[primary_key]]
@@ -36,46 +149,181 @@ def get_collection(name: str) -> Collection:
     return db[name]
 
 
+async def ensure_indexes() -> None:
+    """
+    Create the `id` and `createdAt` indexes used by lookups and list sorting (idempotent).
+    A collection whose indexes can't be built (e.g. duplicate `id` values) is logged and
+    skipped; connection failures are raised since every other collection would fail too.
+    """
+    for name in _COLLECTION_ALIASES:
+        if name in _UNINDEXED_COLLECTIONS:
+            continue
+        try:
+            collection = await get_collection(name)
+            await collection.create_indexes(_RECORD_INDEXES)
+        except ConnectionFailure:
+            raise
+        except PyMongoError as exc:
+            current_app.logger.warning("Could not create MongoDB indexes for %s: %s", name, exc)
+
+
 def serialize_document(document: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert MongoDB document to JSON-serializable dict, preserving a usable `id` field.
-    Removes MongoDB's `_id` field and ensures `id` is a string.
+    Drops Mongo-internal fields in a single pass and ensures `id` is a string.
     """
-    if document is None:
+    if not document:
         return {}
 
-    doc = dict(document)
-    
-    # Handle _id field
-    object_id = doc.pop("_id", None)
-    if object_id is not None:
-        # Ensure id field exists, use _id if id doesn't exist
-        if "id" not in doc:
+    doc = {key: value for key, value in document.items() if key not in _INTERNAL_FIELDS}
+    if "id" not in doc:
+        object_id = document.get("_id")
+        if object_id is not None:
             doc["id"] = str(object_id)
-
-    # Ensure id is a string (not ObjectId)
-    if "id" in doc and isinstance(doc["id"], ObjectId):
+    elif isinstance(doc["id"], ObjectId):
         doc["id"] = str(doc["id"])
-    
-    # Remove any remaining MongoDB-specific fields that shouldn't be exposed
-    doc.pop("__v", None)
-    
     return doc
 
 
-def iso_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO8601 timestamp, treating values without an offset as UTC. Returns None if invalid.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def list_cursor(collection: AsyncCollection) -> Optional[AsyncCommandCursor]:
+    """
+    Build the newest-first cursor for a list endpoint from the optional `limit`, `skip`,
+    `after_id` and `after` query args. `after_id` takes the `id` of the last document seen
+    and returns the ones after it, breaking `createdAt` ties on `_id`; `after` takes a bare
+    `createdAt` value instead. Both avoid the cost of deep `skip` values. Without `limit`
+    every document is returned. Returns None when `after_id` doesn't match a document, so
+    the caller can reject the request instead of restarting from the newest record.
+
+    Documents are shaped server-side (see `_LIST_SHAPE`) and returned as `RawBSONDocument`
+    so `stream_documents` can hand the raw bytes straight to bsonjs.
+    """
+    pipeline: List[Dict[str, Any]] = []
+    anchor = None
+    after_id = request.args.get("after_id")
+    if after_id:
+        anchor = await collection.find_one(build_id_filter(after_id), {"createdAt": 1})
+        if anchor is None:
+            return None
+    after = request.args.get("after")
+    if anchor is not None:
+        created_at = anchor.get("createdAt")
+        clauses = [
+            {"createdAt": {"$lt": created_at}},
+            {"createdAt": created_at, "_id": {"$lt": anchor["_id"]}},
+        ]
+        if isinstance(created_at, datetime):
+            # Mongo sorts every BSON date above every string, so string timestamps follow a date anchor.
+            clauses.append({"createdAt": {"$type": "string"}})
+        pipeline.append({"$match": {"$or": clauses}})
+    elif after:
+        clauses = [{"createdAt": {"$lt": after}}]
+        older_than = _parse_timestamp(after)
+        if older_than is not None:
+            # Legacy documents store `createdAt` as a BSON date, which never compares to a string.
+            clauses.append({"createdAt": {"$lt": older_than}})
+        pipeline.append({"$match": {"$or": clauses}})
+    pipeline.append({"$sort": {"createdAt": -1, "_id": -1}})
+
+    skip = request.args.get("skip", 0, type=int)
+    if skip > 0:
+        pipeline.append({"$skip": skip})
+    limit = request.args.get("limit", 0, type=int)
+    if limit > 0:
+        pipeline.append({"$limit": limit})
+    pipeline.extend(_LIST_SHAPE)
+
+    raw_collection = collection.with_options(codec_options=_RAW_CODEC_OPTIONS)
+    return await raw_collection.aggregate(pipeline, batchSize=_LIST_BATCH_SIZE)
+
+
+def stream_documents(cursor: AsyncCommandCursor) -> Response:
+    """
+    Stream a cursor of raw documents as a JSON array, converting BSON to JSON in C via bsonjs.
+    """
+
+    async def generate() -> AsyncIterator[str]:
+        # Close the cursor even when the client disconnects mid-stream.
+        try:
+            yield "["
+            separator = ""
+            async for document in cursor:
+                yield separator + bsonjs.dumps(document.raw)
+                separator = ","
+            yield "]"
+        finally:
+            await cursor.close()
+
+    return Response(generate(), mimetype="application/json")
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        # Mongo returns naive UTC datetimes; match `_DATE_FORMAT` (`%L` is milliseconds).
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return f"{value:%Y-%m-%dT%H:%M:%S}.{value.microsecond // 1000:03d}Z"
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def ojson(payload: Any, status: int = HTTPStatus.OK) -> Response:
+    """
+    JSON response encoded with orjson (drop-in for `jsonify`); ObjectIds and datetimes are
+    rendered as strings, in the same form as list responses.
+    """
+    body = orjson.dumps(payload, default=_orjson_default, option=_ORJSON_OPTIONS)
+    return Response(body, status=status, mimetype="application/json")
 
 
 def build_id_filter(identifier: str) -> Dict[str, Any]:
     """
-    Build a filter that matches either the custom `id` field or the Mongo `_id` ObjectId.
+    Build a single-field filter for a record identifier. 24-hex identifiers are the
+    stringified `_id` exposed for legacy documents without a custom `id`, so they match on
+    `_id`; anything else (e.g. 'A001') matches the custom `id` field.
     """
-    candidates: list[Dict[str, Any]] = [{"id": identifier}]
-    if ObjectId.is_valid(identifier):
-        candidates.append({"_id": ObjectId(identifier)})
+    if _OBJECT_ID_HEX.fullmatch(identifier):
+        return {"_id": ObjectId(identifier)}
+    return {"id": identifier}
 
-    if len(candidates) == 1:
-        return candidates[0]
-    return {"$or": candidates}
 
+def projection_for(id_filter: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Pick the projection for a document matched by `build_id_filter`. Matches on the custom
+    `id` field don't need `_id`; matches by ObjectId keep it for `serialize_document`.
+    """
+    if "id" in id_filter:
+        return DEFAULT_PROJECTION
+    return ID_FALLBACK_PROJECTION
+
+
+async def apply_update(
+    collection: AsyncCollection,
+    id_filter: Dict[str, Any],
+    updates: Dict[str, Any],
+    stages: Sequence[Dict[str, Any]] = (),
+) -> Optional[Dict[str, Any]]:
+    """
+    Apply a partial update as a single pipeline `find_one_and_update` and return the updated
+    document (or None when nothing matched). Payload values are wrapped in `$literal` so
+    they are stored as-is rather than evaluated; `stages` run after the `$set`.
+    """
+    fields = {key: {"$literal": value} for key, value in updates.items()}
+    fields["updatedAt"] = iso_now()
+    return await collection.find_one_and_update(
+        id_filter,
+        [{"$set": fields}, *stages],
+        projection=projection_for(id_filter),
+        return_document=ReturnDocument.AFTER,
+    )
@@ -1,18 +1,4 @@
-from http import HTTPStatus
-from typing import Any, Dict, Optional, Tuple
-
-from flask import Blueprint, jsonify, request
-from pymongo import ReturnDocument
-
-from ..utils.id_generator import get_next_id, timestamp_pair
-from .helpers import build_id_filter, get_collection, iso_now, serialize_document
-
-
-inventory_bp = Blueprint("inventory", __name__, url_prefix="/api/inventory")
-
-
-def _collection():
-    return get_collection("inventoryitems")
+from typing import Any, Dict, List, Optional, Tuple
 
 
 def _compute_status(quantity: float, reorder_level: float) -> str:
@@ -23,91 +9,69 @@ def _compute_status(quantity: float, reorder_level: float) -> str:
     return "In Stock"
 
 
-def _extract_numbers(payload: Dict[str, Any], existing: Optional[Dict[str, Any]] = None) -> Tuple[float, float]:
-    def _number(value, fallback):
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return float(fallback)
-
-    base_quantity = existing["quantity"] if existing else 0
-    base_reorder = existing["reorderLevel"] if existing else 0
-
-    quantity = _number(payload.get("quantity", base_quantity), base_quantity)
-    reorder_level = _number(payload.get("reorderLevel", base_reorder), base_reorder)
-    return quantity, reorder_level
-
-
-@inventory_bp.get("/")
-def list_inventory():
-    docs = list(_collection().find().sort("createdAt", -1))
-    return jsonify([serialize_document(doc) for doc in docs])
-
-
-@inventory_bp.get("/<item_id>")
-def get_inventory_item(item_id: str):
-    doc = _collection().find_one(build_id_filter(item_id))
-    if not doc:
-        return jsonify({"error": "Inventory item not found"}), HTTPStatus.NOT_FOUND
-    return jsonify(serialize_document(doc))
-
-
-@inventory_bp.post("/")
-def create_inventory_item():
-    payload: Dict[str, Any] = request.get_json(silent=True) or {}
-    required_fields = {"name", "category", "quantity", "unit", "reorderLevel", "costPerUnit"}
-    missing = sorted(required_fields - payload.keys())
-    if missing:
-        return jsonify({"error": f"Missing required fields: {', '.join(missing)}"}), HTTPStatus.BAD_REQUEST
-
-    collection = _collection()
-    new_id = get_next_id(collection, "I", 3)
-    created_at, updated_at = timestamp_pair()
+# Server-side equivalent of `_extract_numbers` + `_compute_status`, applied after the
+# `$set` stage of `apply_update` so status reflects the merged quantity and reorder level.
+STATUS_STAGES: List[Dict[str, Any]] = [
+    {
+        "$set": {
+            field: {"$convert": {"input": f"${field}", "to": "double", "onError": 0.0, "onNull": 0.0}}
+            for field in ("quantity", "reorderLevel")
+        }
+    },
+    {
+        "$set": {
+            "status": {
+                "$switch": {
+                    "branches": [
+                        {"case": {"$lte": ["$quantity", 0]}, "then": "Out of Stock"},
+                        {"case": {"$lte": ["$quantity", "$reorderLevel"]}, "then": "Low Stock"},
+                    ],
+                    "default": "In Stock",
+                }
+            }
+        }
+    },
+]
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _extract_numbers(payload: Dict[str, Any]) -> Tuple[float, float]:
+    quantity = _number(payload.get("quantity", 0))
+    reorder_level = _number(payload.get("reorderLevel", 0))
+    return quantity or 0.0, reorder_level or 0.0
+
+
+def prepare_update(updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize quantity / reorder level in a partial update. Values that aren't numeric are
+    dropped, keeping the stored value (matching create-time coercion).
+    """
+    changes = dict(updates)
+    for field in ("quantity", "reorderLevel"):
+        if field in changes:
+            number = _number(changes[field])
+            if number is None:
+                del changes[field]
+            else:
+                changes[field] = number
+    return changes
+
+
+def prepare_create(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Coerce quantity / reorder level to numbers and derive the stock status of a new item.
+    """
     quantity, reorder_level = _extract_numbers(payload)
-
-    document = {
+    return {
         **payload,
         "quantity": quantity,
         "reorderLevel": reorder_level,
         "status": _compute_status(quantity, reorder_level),
-        "id": new_id,
-        "createdAt": created_at,
-        "updatedAt": updated_at,
     }
-    collection.insert_one(document)
-    return jsonify(serialize_document(document)), HTTPStatus.CREATED
-
-
-@inventory_bp.put("/<item_id>")
-def update_inventory_item(item_id: str):
-    updates: Dict[str, Any] = request.get_json(silent=True) or {}
-    if not updates:
-        return jsonify({"error": "No data provided"}), HTTPStatus.BAD_REQUEST
-
-    collection = _collection()
-    existing = collection.find_one(build_id_filter(item_id))
-    if not existing:
-        return jsonify({"error": "Inventory item not found"}), HTTPStatus.NOT_FOUND
-
-    quantity, reorder_level = _extract_numbers(updates, existing)
-    updates["quantity"] = quantity
-    updates["reorderLevel"] = reorder_level
-    updates["status"] = _compute_status(quantity, reorder_level)
-    updates["updatedAt"] = iso_now()
-
-    updated = collection.find_one_and_update(
-        build_id_filter(item_id),
-        {"$set": updates},
-        return_document=ReturnDocument.AFTER,
-    )
-    return jsonify(serialize_document(updated))
-
-
-@inventory_bp.delete("/<item_id>")
-def delete_inventory_item(item_id: str):
-    deleted = _collection().find_one_and_delete(build_id_filter(item_id))
-    if not deleted:
-        return jsonify({"error": "Inventory item not found"}), HTTPStatus.NOT_FOUND
-    return jsonify({"message": "Inventory item deleted successfully"})
-
 
@@ -0,0 +1,68 @@
+import os
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from cachetools import TTLCache
+
+_READ_CACHE_MAXSIZE = 4096
+_READ_CACHE_TTL_SECONDS = 15
+
+
+class DocumentCache:
+    """
+    Per-worker TTL cache of serialized documents. All access happens on the worker's event
+    loop, so no lock is needed. The generation is bumped by every invalidation so a read that
+    started before a write cannot store the stale document; other workers only see a write
+    once their entry expires.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Return the cached document for `key` (or None) and the generation to pass to `store`.
+        """
+        return self._entries.get(key), self._generation
+
+    def store(self, key: Hashable, document: Dict[str, Any], generation: int) -> None:
+        if generation == self._generation:
+            self._entries[key] = document
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        self._generation += 1
+
+
+@lru_cache(maxsize=1)
+def _record_cache() -> Optional[DocumentCache]:
+    """
+    Cache of single-record GETs, enabled with ENABLE_READ_CACHE=1. Built lazily so the flag
+    is read after `load_dotenv()` has run.
+    """
+    if os.getenv("ENABLE_READ_CACHE") != "1":
+        return None
+    return DocumentCache(_READ_CACHE_MAXSIZE, _READ_CACHE_TTL_SECONDS)
+
+
+def cached_document(key: Hashable) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Return the cached record for `key` (or None) and the generation to pass to `store_document`.
+    """
+    cache = _record_cache()
+    if cache is None:
+        return None, 0
+    return cache.get(key)
+
+
+def store_document(key: Hashable, document: Dict[str, Any], generation: int) -> None:
+    cache = _record_cache()
+    if cache is not None:
+        cache.store(key, document, generation)
+
+
+def invalidate_document(key: Hashable) -> None:
+    cache = _record_cache()
+    if cache is not None:
+        cache.invalidate(key)
@@ -1,60 +1,83 @@
 from http import HTTPStatus
 from typing import Any, Dict
 
-from flask import Blueprint, jsonify, request
 from pymongo import ReturnDocument
+from quart import Blueprint, request
 
-from .helpers import get_collection, iso_now, serialize_document
+from ..utils.timestamps import iso_now
+from .helpers import ID_FALLBACK_PROJECTION, get_collection, ojson, serialize_document
+from .read_cache import DocumentCache
 
 
 settings_bp = Blueprint("settings", __name__, url_prefix="/api/settings")
 
 
-def _collection():
-    return get_collection("settings")
+async def _collection():
+    return await get_collection("settings")
 
 
-DEFAULT_SETTINGS = {
-    "facilityName": "Green Valley Animal Care Center",
-    "registrationNumber": "FAC-2023-001",
-    "address": "123 Animal Care Lane, Green Valley, CA 90210",
-    "phone": "(555) 123-4567",
-    "email": "contact@greenvalley.com",
-    "operatingHours": "Monday - Saturday: 8:00 AM - 6:00 PM",
-    "notificationPreferences": {
-        "lowStockAlerts": True,
-        "healthReminders": True,
-        "breedingAlerts": True,
-        "feedingReminders": True,
-        "emailSummary": False,
-    },
-    "lastBackup": iso_now(),
-}
+def _default_settings() -> Dict[str, Any]:
+    """
+    Fresh default settings document; timestamps reflect when it is first created.
+    """
+    now = iso_now()
+    return {
+        "facilityName": "Green Valley Animal Care Center",
+        "registrationNumber": "FAC-2023-001",
+        "address": "123 Animal Care Lane, Green Valley, CA 90210",
+        "phone": "(555) 123-4567",
+        "email": "contact@greenvalley.com",
+        "operatingHours": "Monday - Saturday: 8:00 AM - 6:00 PM",
+        "notificationPreferences": {
+            "lowStockAlerts": True,
+            "healthReminders": True,
+            "breedingAlerts": True,
+            "feedingReminders": True,
+            "emailSummary": False,
+        },
+        "lastBackup": now,
+        "createdAt": now,
+        "updatedAt": now,
+    }
+
+
+# Serialized settings served from memory for up to 30 seconds; PUT invalidates it.
+_CACHE = DocumentCache(maxsize=1, ttl=30.0)
+_CACHE_KEY = "settings"
 
 
 @settings_bp.get("/")
-def get_settings():
-    collection = _collection()
-    settings = collection.find_one()
+async def get_settings():
+    cached, generation = _CACHE.get(_CACHE_KEY)
+    if cached is not None:
+        return ojson(cached)
+
+    collection = await _collection()
+    settings = await collection.find_one({}, ID_FALLBACK_PROJECTION)
     if not settings:
-        document = {**DEFAULT_SETTINGS, "createdAt": iso_now(), "updatedAt": iso_now()}
-        collection.insert_one(document)
+        document = _default_settings()
+        await collection.insert_one(document)
         settings = document
-    return jsonify(serialize_document(settings))
+
+    serialized = serialize_document(settings)
+    _CACHE.store(_CACHE_KEY, serialized, generation)
+    return ojson(serialized)
 
 
 @settings_bp.put("/")
-def update_settings():
-    payload: Dict[str, Any] = request.get_json(silent=True) or {}
-    collection = _collection()
-    updated = collection.find_one_and_update(
+async def update_settings():
+    payload: Dict[str, Any] = (await request.get_json(silent=True)) or {}
+    collection = await _collection()
+    updated = await collection.find_one_and_update(
         {},
         {"$set": {**payload, "updatedAt": iso_now()}},
+        projection=ID_FALLBACK_PROJECTION,
         upsert=True,
         return_document=ReturnDocument.AFTER,
     )
+    _CACHE.invalidate(_CACHE_KEY)
     if not updated:
-        return jsonify({"error": "Unable to update settings"}), HTTPStatus.INTERNAL_SERVER_ERROR
-    return jsonify(serialize_document(updated))
+        return ojson({"error": "Unable to update settings"}, HTTPStatus.INTERNAL_SERVER_ERROR)
+    return ojson(serialize_document(updated))
 
 
@@ -1,40 +1,72 @@
-from datetime import datetime, timezone
-from typing import Tuple
+import re
+from typing import List, Tuple
 
-from pymongo.collection import Collection
+from pymongo import ReturnDocument
+from pymongo.asynchronous.collection import AsyncCollection
 
+from .timestamps import iso_now
 
-def _parse_id(doc_id: str, prefix: str) -> int:
+COUNTERS_COLLECTION = "counters"
+
+
+async def _latest_numeric(collection: AsyncCollection, prefix: str) -> int:
+    """
+    Find the highest numeric suffix among identifiers with the prefix (used once to seed a counter).
+    Compares the suffixes as numbers, since string order puts 'A999' above 'A1000'.
+    """
+    pipeline = [
+        {"$match": {"id": {"$regex": f"^{re.escape(prefix)}[0-9]+$"}}},
+        {"$group": {"_id": None, "seq": {"$max": {"$toLong": {"$substrCP": ["$id", len(prefix), 32]}}}}},
+    ]
+    result = await (await collection.aggregate(pipeline)).to_list(1)
+    return int(result[0]["seq"]) if result else 0
+
+
+async def _reserve(collection: AsyncCollection, prefix: str, count: int) -> int:
     """
-    Extract the numeric portion of an identifier like 'A001'.
+    Atomically advance the prefix counter by `count` and return the last reserved number.
     """
-    if not doc_id.startswith(prefix):
-        return 0
-    try:
-        return int(doc_id[len(prefix):])
-    except ValueError:
-        return 0
+    counters = collection.database[COUNTERS_COLLECTION]
+    counter = await counters.find_one_and_update(
+        {"_id": prefix},
+        {"$inc": {"seq": count}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if counter is None:
+        # First use: seed from existing documents so ids keep counting from the current maximum.
+        seed = await _latest_numeric(collection, prefix)
+        await counters.update_one({"_id": prefix}, {"$max": {"seq": seed}}, upsert=True)
+        counter = await counters.find_one_and_update(
+            {"_id": prefix},
+            {"$inc": {"seq": count}},
+            return_document=ReturnDocument.AFTER,
+        )
+    return counter["seq"]
 
 
-def get_next_id(collection: Collection, prefix: str, width: int = 3) -> str:
+async def get_next_id(collection: AsyncCollection, prefix: str, width: int = 3) -> str:
     """
     Generate the next identifier for a collection using a prefix and zero-padded width.
+    Sequence numbers come from an atomic `$inc` on a per-prefix document in the counters collection.
     """
-    latest = collection.find({"id": {"$regex": f"^{prefix}"}}).sort("id", -1).limit(1)
-    try:
-        last_doc = next(latest)
-        next_numeric = _parse_id(last_doc["id"], prefix) + 1
-    except (StopIteration, KeyError):
-        next_numeric = 1
-    padded = str(next_numeric).zfill(width)
+    seq = await _reserve(collection, prefix, 1)
+    padded = str(seq).zfill(width)
     return f"{prefix}{padded}"
 
 
+async def get_next_ids(collection: AsyncCollection, prefix: str, count: int, width: int = 3) -> List[str]:
+    """
+    Reserve `count` consecutive identifiers with a single counter update.
+    """
+    last = await _reserve(collection, prefix, count)
+    return [f"{prefix}{str(seq).zfill(width)}" for seq in range(last - count + 1, last + 1)]
+
+
 def timestamp_pair() -> Tuple[str, str]:
     """
     Utility to generate ISO8601 timestamps for createdAt / updatedAt.
     """
-    now = datetime.now(timezone.utc).isoformat()
+    now = iso_now()
     return now, now
 
 
@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+
+from quart import g, has_app_context
+
+
+def iso_now() -> str:
+    """
+    Current UTC time in ISO8601. Within a request the first value is stored on `g` and
+    reused, so every timestamp written by one request is identical.
+    """
+    if not has_app_context():
+        return datetime.now(timezone.utc).isoformat()
+
+    now = g.get("_iso_now")
+    if now is None:
+        now = datetime.now(timezone.utc).isoformat()
+        g._iso_now = now
+    return now